@@ -0,0 +1,48 @@
+"""
+Indented JSON output for the scripts, using orjson when it is installed.
+"""
+
+import sys
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+    import json
+
+
+def dumps(obj):
+    """Serialize obj as 2-space indented UTF-8 JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode()
+
+
+def write(obj, stream=None):
+    """Write obj as indented JSON plus a newline to a binary stream (stdout by default)."""
+    if stream is None:
+        sys.stdout.flush()  # keep ordering with any earlier text output
+        stream = sys.stdout.buffer
+    stream.write(dumps(obj) + b"\n")
+    stream.flush()
+
+
+def write_array(items, stream=None):
+    """Stream an iterable as an indented JSON array, one element at a time.
+
+    The output matches write(list(items)), without holding every element in
+    memory at once. Returns the number of elements written.
+    """
+    if stream is None:
+        sys.stdout.flush()
+        stream = sys.stdout.buffer
+    count = 0
+    stream.write(b"[")
+    for item in items:
+        stream.write(b",\n  " if count else b"\n  ")
+        stream.write(dumps(item).replace(b"\n", b"\n  "))
+        stream.flush()
+        count += 1
+    stream.write(b"\n]\n" if count else b"]\n")
+    stream.flush()
+    return count
@@ -0,0 +1,28 @@
+"""
+In-process SMILES -> RDKit Mol cache shared by the tautomer scripts.
+
+Each SMILES is parsed once per process and kept as an RDKit binary blob
+(Mol.ToBinary), so callers always get a fresh Mol they are free to modify,
+and the blob can be handed to worker processes without re-parsing.
+"""
+
+from functools import lru_cache
+
+from rdkit import Chem
+
+
+@lru_cache(maxsize=None)
+def binary(smiles):
+    """Return Mol.ToBinary() for smiles, or b"" if RDKit cannot parse it."""
+    mol = Chem.MolFromSmiles(smiles)
+    return mol.ToBinary() if mol is not None else b""
+
+
+def from_binary(blob):
+    """Rebuild a Mol from a blob returned by binary() (None if empty)."""
+    return Chem.Mol(blob) if blob else None
+
+
+def parse(smiles):
+    """Parse smiles through the cache. Returns a fresh Mol, or None."""
+    return from_binary(binary(smiles))
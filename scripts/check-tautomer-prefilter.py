@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Check the has_tautomer_site() pre-filter in tautomer_core against RDKit.
+
+For every molecule the pre-filter would skip, run RDKit's full
+Enumerate/Canonicalize and confirm it finds no tautomer other than the
+input itself. Exits non-zero if any molecule was wrongly skipped.
+
+Usage:
+    python3 scripts/check-tautomer-prefilter.py [--limit N] [SMILES_FILE ...]
+"""
+
+from tautomer_core import get_enumerator, has_tautomer_site, load_cases
+from rdkit import Chem
+import argparse
+import os
+import sys
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_FILES = [
+    os.path.join(HERE, "..", "test", "smiles", "rdkit-comparison", "smiles-10k.txt"),
+    os.path.join(HERE, "tautomer-cases", "basic.csv"),
+    os.path.join(HERE, "tautomer-cases", "extended.csv"),
+    os.path.join(HERE, "tautomer-cases", "high-complexity.csv"),
+]
+
+
+def read_smiles(path):
+    """SMILES from a tautomer-cases CSV, or one per line from any other file."""
+    if path.endswith(".csv"):
+        return [smiles for smiles, _, _ in load_cases(path)]
+    with open(path) as f:
+        return [line.strip() for line in f if line.strip()]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("files", nargs="*", default=DEFAULT_FILES,
+                        help="SMILES files to check (default: smiles-10k.txt and tautomer-cases/*.csv)")
+    parser.add_argument("--limit", type=int, default=None,
+                        help="check at most this many SMILES per file")
+    parser.add_argument("--max", type=int, default=32,
+                        help="max tautomers for RDKit's enumeration (default: 32)")
+    args = parser.parse_args(argv)
+
+    enumerator = get_enumerator(args.max)
+    checked = skipped = 0
+    misses = []
+    for path in args.files:
+        for smiles in read_smiles(path)[:args.limit]:
+            mol = Chem.MolFromSmiles(smiles)
+            if mol is None:
+                continue
+            checked += 1
+            if has_tautomer_site(mol):
+                continue
+            skipped += 1
+            expected = Chem.MolToSmiles(mol)
+            tautomers = {Chem.MolToSmiles(t) for t in enumerator.Enumerate(mol)}
+            canonical = Chem.MolToSmiles(enumerator.Canonicalize(mol))
+            if tautomers != {expected} or canonical != expected:
+                misses.append((smiles, sorted(tautomers), canonical))
+
+    for smiles, tautomers, canonical in misses:
+        print(f"MISS {smiles}: RDKit tautomers {tautomers}, canonical {canonical}")
+    print(f"Checked {checked} molecules, {skipped} skipped by the pre-filter, "
+          f"{len(misses)} wrongly skipped", file=sys.stderr)
+    return 1 if misses else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
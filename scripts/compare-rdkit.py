@@ -1,10 +1,14 @@
 #!/usr/bin/env python3
 """Compare coordinate generation with RDKit"""
 
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from pathlib import Path
 from rdkit import Chem
 from rdkit.Chem import AllChem, Draw
+import argparse
+import numpy as np
 import sys
-import os
 
 molecules = [
     ("Adamantane", "C1C2CC3CC1CC(C2)C3"),
@@ -12,37 +16,84 @@ molecules = [
     ("Coronene", "c1cc2ccc3ccc4ccc5ccc6ccc1c7c2c3c4c5c67"),
 ]
 
-out_dir = "output/svg/rdkit"
-os.makedirs(out_dir, exist_ok=True)
+out_dir = Path("output/svg/rdkit")
 
-for name, smiles in molecules:
+
+def process(name_smiles, canon_orient=True):
+    """Generate coordinates, SVG and bond lengths for one molecule.
+
+    The molecule is also returned (as an RDKit binary, with its 2D
+    conformer) so the parent can draw the combined grid. canon_orient=False
+    skips RDKit's canonical re-orientation pass, which is faster but
+    rotates the depiction.
+    """
+    name, smiles = name_smiles
     mol = Chem.MolFromSmiles(smiles)
     if mol is None:
-        print(f"Failed to parse {name}")
-        continue
-    
+        return name, None, None, None
+
     # Generate 2D coordinates
-    AllChem.Compute2DCoords(mol)
-    
-    # Save as SVG
+    AllChem.Compute2DCoords(mol, canonOrient=canon_orient, clearConfs=True)
+
+    # Render as SVG
     drawer = Draw.MolDraw2DSVG(400, 300)
     drawer.DrawMolecule(mol)
     drawer.FinishDrawing()
     svg = drawer.GetDrawingText()
-    
-    fname = os.path.join(out_dir, f"{name}.svg")
-    with open(fname, "w") as f:
-        f.write(svg)
-    print(f"Wrote {fname}")
-    
-    # Print bond lengths for comparison
-    conf = mol.GetConformer()
-    print(f"\n{name} RDKit bond lengths:")
-    for bond in mol.GetBonds():
-        i, j = bond.GetBeginAtomIdx(), bond.GetEndAtomIdx()
-        p1 = conf.GetAtomPosition(i)
-        p2 = conf.GetAtomPosition(j)
-        dist = ((p1.x - p2.x)**2 + (p1.y - p2.y)**2)**0.5
-        print(f"  {i}-{j}: {dist:.2f}")
-
-print("\nDone!")
+
+    # Bond lengths for comparison
+    pos = np.asarray(mol.GetConformer().GetPositions())[:, :2]
+    n_bonds = mol.GetNumBonds()
+    bonds = mol.GetBonds()
+    begin = np.fromiter((b.GetBeginAtomIdx() for b in bonds), dtype=np.int32, count=n_bonds)
+    end = np.fromiter((b.GetEndAtomIdx() for b in bonds), dtype=np.int32, count=n_bonds)
+    dists = np.linalg.norm(pos[begin] - pos[end], axis=1)
+    bond_lengths = "\n".join(f"  {i}-{j}: {d:.2f}" for i, j, d in zip(begin, end, dists))
+
+    return name, svg, bond_lengths, mol.ToBinary()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--no-canon-orient", action="store_true",
+                        help="skip canonical orientation (faster, but SVGs are rotated)")
+    args = parser.parse_args()
+
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    # Molecules are independent, so compute them in parallel. SVG writes are
+    # handed to a thread pool as results arrive, and stdout is collected
+    # into a single write at the end.
+    out = []
+    writes = []
+    grid = []
+    job = partial(process, canon_orient=not args.no_canon_orient)
+    with ProcessPoolExecutor(max_workers=len(molecules)) as ex, \
+            ThreadPoolExecutor(2) as io_pool:
+        for name, svg, bond_lengths, blob in ex.map(job, molecules):
+            if svg is None:
+                out.append(f"Failed to parse {name}\n")
+                continue
+
+            fname = out_dir / f"{name}.svg"
+            writes.append(io_pool.submit(fname.write_text, svg))
+            out.append(f"Wrote {fname}\n")
+
+            out.append(f"\n{name} RDKit bond lengths:\n{bond_lengths}\n")
+            grid.append((name, Chem.Mol(blob)))
+
+        # All molecules side by side from a single drawer
+        if grid:
+            drawer = Draw.MolDraw2DSVG(400 * len(grid), 300, 400, 300)
+            drawer.DrawMolecules([m for _, m in grid], legends=[n for n, _ in grid])
+            drawer.FinishDrawing()
+            fname = out_dir / "grid.svg"
+            writes.append(io_pool.submit(fname.write_text, drawer.GetDrawingText()))
+            out.append(f"\nWrote {fname}\n")
+
+    # Surface any write errors
+    for w in writes:
+        w.result()
+
+    out.append("\nDone!\n")
+    sys.stdout.write("".join(out))
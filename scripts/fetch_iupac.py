@@ -1,84 +1,132 @@
+import asyncio
 import json
-import time
-import pubchempy as pcp
 import os
+import time
+from pathlib import Path
+import aiohttp
+import _jsonout
 
 # Configuration
 SMILES_FILE = 'test/smiles/rdkit-comparison/smiles-10k.txt'
-BATCH_SIZE = 15
-OUTPUT_DIR = '.'
-RATE_LIMIT_DELAY = 0.2  # seconds between requests
+STREAM_FILE = 'all_results.jsonl'  # appended as results arrive; enables resume
+OUTPUT_FILE = 'all_results.json'
+MAX_CONCURRENT = 5  # requests in flight at once
+REQUESTS_PER_SECOND = 5  # PubChem usage policy limit
+PUG_URL = 'https://pubchem.ncbi.nlm.nih.gov/rest/pug/compound/smiles/property/IUPACName/JSON'
 
-def fetch_iupac_batch(smiles_batch):
+class TokenBucket:
     """
-    Fetch IUPAC names for a batch of SMILES from PubChem.
+    Async token-bucket rate limiter refilled at rate tokens per second.
+
+    The bucket starts empty and holds at most capacity tokens. With
+    capacity 1, requests are spaced at least 1/rate seconds apart, so no
+    1-second window ever sees more than rate requests.
     """
-    results = []
-    for smiles in smiles_batch:
+    def __init__(self, rate, capacity=1):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = 0
+        self.t = time.monotonic()
+        self.lock = asyncio.Lock()
+
+    async def take(self):
+        async with self.lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.t) * self.rate)
+                self.t = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                # Re-check after sleeping in case the loop woke us early
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+async def fetch_iupac(session, semaphore, bucket, smiles):
+    """
+    Fetch the IUPAC name for a single SMILES from PubChem PUG-REST.
+    """
+    async with semaphore:
+        await bucket.take()
         try:
-            compounds = pcp.get_compounds(smiles, 'smiles')
-            if compounds:
-                iupac = compounds[0].iupac_name or ''
-            else:
-                iupac = ''
-            results.append({"smiles": smiles, "iupacName": iupac})
+            # POST keeps SMILES characters like '/' and '#' out of the URL
+            async with session.post(PUG_URL, data={'smiles': smiles}) as r:
+                if r.status == 404:
+                    return {"smiles": smiles, "iupacName": ""}
+                r.raise_for_status()
+                data = await r.json()
+            props = data.get('PropertyTable', {}).get('Properties', [])
+            iupac = props[0].get('IUPACName', '') if props else ''
+            return {"smiles": smiles, "iupacName": iupac}
         except Exception as e:
+            # Recorded with an "error" field so a later run retries it
             print(f"Error for {smiles}: {e}")
-            results.append({"smiles": smiles, "iupacName": ""})
-        time.sleep(RATE_LIMIT_DELAY)  # rate limit per request
-    return results
+            return {"smiles": smiles, "iupacName": "", "error": str(e)}
+
+async def fetch_all(smiles, out):
+    """
+    Fetch all SMILES concurrently, appending each result to out as it lands.
+    """
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT)
+    bucket = TokenBucket(REQUESTS_PER_SECOND)
+    # One pooled, keep-alive connector shared by every request, so TLS
+    # handshakes are reused; the semaphore above bounds the pool's size.
+    connector = aiohttp.TCPConnector(ttl_dns_cache=300, keepalive_timeout=30)
+    async with aiohttp.ClientSession(connector=connector) as session:
+        tasks = [fetch_iupac(session, semaphore, bucket, s) for s in smiles]
+        for task in asyncio.as_completed(tasks):
+            result = await task
+            out.write(json.dumps(result) + "\n")
+            out.flush()
+
+def load_stream():
+    """
+    Read previously fetched results from STREAM_FILE, if any.
+
+    An unterminated last line, left by an interrupted run, is cut off so
+    that new results are appended after the last complete row.
+    """
+    if not os.path.exists(STREAM_FILE):
+        return []
+    with open(STREAM_FILE, 'rb+') as f:
+        data = f.read()
+        end = data.rfind(b"\n") + 1
+        if end < len(data):
+            print(f"Dropping incomplete last line of {STREAM_FILE}")
+            f.truncate(end)
+    return [json.loads(line) for line in data[:end].splitlines() if line.strip()]
 
 def main():
     # Read SMILES from file
-    smiles = []
     try:
-        with open(SMILES_FILE, 'r') as f:
-            for line in f:
-                line = line.strip()
-                if line:
-                    smiles.append(line)
+        lines = Path(SMILES_FILE).read_text().splitlines()
     except FileNotFoundError:
         print(f"Error: {SMILES_FILE} not found.")
         return
-    
+
     # Take first 300 SMILES
-    smiles = smiles[:300]
+    smiles = [s for s in (line.strip() for line in lines) if s][:300]
     print(f"Processing {len(smiles)} SMILES strings.")
-    
-    # Process in batches
-    for i in range(0, len(smiles), BATCH_SIZE):
-        batch = smiles[i:i + BATCH_SIZE]
-        batch_num = (i // BATCH_SIZE) + 1
-        
-        print(f"Fetching batch {batch_num}...")
-        results = fetch_iupac_batch(batch)
-        
-        # Write to JSON file
-        filename = f"batch_{batch_num}.json"
-        if os.path.exists(filename):
-            print(f"Skipping {filename}")
-            continue
-        with open(filename, 'w') as f:
-            json.dump(results, f, indent=2)
-        
-        print(f"Written {filename}")
-        
-        # Rate limiting already in fetch
 
-    # Merge all batch files into one
-    all_results = []
-    num_batches = (len(smiles) + BATCH_SIZE - 1) // BATCH_SIZE
-    for i in range(1, num_batches + 1):
-        filename = f"batch_{i}.json"
-        if os.path.exists(filename):
-            with open(filename, 'r') as f:
-                batch_data = json.load(f)
-                all_results.extend(batch_data)
-    
-    with open("all_results.json", 'w') as f:
-        json.dump(all_results, f, indent=2)
-    
-    print("Merged all results to all_results.json")
+    # Skip SMILES already fetched by an earlier (possibly interrupted) run;
+    # failed requests are fetched again
+    done = {r["smiles"] for r in load_stream() if "error" not in r}
+    pending = [s for s in smiles if s not in done]
+    if done:
+        print(f"Resuming: {len(smiles) - len(pending)} already fetched.")
+
+    with open(STREAM_FILE, 'a') as out:
+        asyncio.run(fetch_all(pending, out))
+
+    # Rows arrive in completion order; write them back in input order, with
+    # the latest row for each SMILES winning over earlier failed attempts
+    by_smiles = {}
+    for r in load_stream():
+        by_smiles[r["smiles"]] = {"smiles": r["smiles"], "iupacName": r["iupacName"]}
+    all_results = [by_smiles[s] for s in smiles if s in by_smiles]
+    with open(OUTPUT_FILE, 'wb') as f:
+        _jsonout.write(all_results, f)
+
+    print(f"Written {len(all_results)} results to {OUTPUT_FILE}")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Generate RDKit tautomer expectations for a CSV file of test cases.
+
+Usage:
+    python3 scripts/tautomer_cli.py --cases scripts/tautomer-cases/extended.csv --parallel
+
+Each row's max_tautomers column sets its enumeration limit (32 if empty);
+passing --max overrides it for every row.
+"""
+
+from tautomer_core import iter_cases, load_cases
+import argparse
+import _jsonout
+import sys
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--cases", required=True,
+                        help="CSV file with smiles,name,max_tautomers columns")
+    parser.add_argument("--max", type=int, default=None,
+                        help="max tautomers for every row, overriding the CSV's max_tautomers "
+                             "column (default: the row's own limit, or 32 if it has none)")
+    parser.add_argument("--max-shown", type=int, default=None,
+                        help="list at most this many tautomers per molecule")
+    parser.add_argument("--parallel", action="store_true",
+                        help="enumerate test cases in parallel worker processes")
+    parser.add_argument("--sort", action="store_true",
+                        help="sort output by tautomer count (holds all results in memory)")
+    parser.add_argument("--label", default="test cases",
+                        help="what to call the cases in progress messages")
+    args = parser.parse_args(argv)
+
+    test_cases = load_cases(args.cases)
+    if args.max is not None:
+        # An explicit --max wins over per-row limits
+        test_cases = [(smiles, name, args.max) for smiles, name, _ in test_cases]
+    print(f"Processing {len(test_cases)} {args.label}...", file=sys.stderr)
+
+    results = iter_cases(test_cases, max_shown=args.max_shown, parallel=args.parallel)
+
+    if args.sort:
+        results = list(results)
+        print(f"\nCompleted {len(results)} molecules", file=sys.stderr)
+
+        # Sort by tautomer count
+        results.sort(key=lambda x: x.get("count", 0), reverse=True)
+
+        print("\n=== TOP MOLECULES BY TAUTOMER COUNT ===", file=sys.stderr)
+        for r in results[:10]:
+            if "count" in r:
+                print(f"{r['count']:3d} tautomers: {r['name']}", file=sys.stderr)
+
+        # Output as JSON
+        _jsonout.write(results)
+    else:
+        # Stream results out as JSON
+        count = _jsonout.write_array(results)
+        print(f"\nCompleted {count} molecules", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,197 @@
+"""
+Shared RDKit tautomer helpers for the tautomer comparison scripts.
+"""
+
+from collections import Counter, deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from functools import lru_cache
+import csv
+import os
+import sys
+
+from rdkit import Chem
+from rdkit.Chem.MolStandardize import rdMolStandardize
+
+import _molcache
+
+# Every RDKit tautomer transform moves an H onto or off an atom that is in,
+# or next to, a double/triple/aromatic bond; the one exception is the
+# phosphonic acid rule (P-OH). Molecules matching none of these patterns
+# cannot tautomerize, so enumeration is skipped for them. Re-check this
+# against RDKit with scripts/check-tautomer-prefilter.py.
+_TAUTOMER_SITES = [
+    Chem.MolFromSmarts(sma)
+    for sma in ("[!H0]~*=,#,:*", "[!H0]=,#,:*", "[OH]-[#15]")
+]
+
+
+def has_tautomer_site(mol):
+    """Return True if any RDKit tautomer rule could apply to mol."""
+    return any(mol.HasSubstructMatch(patt) for patt in _TAUTOMER_SITES)
+
+
+@lru_cache(maxsize=None)
+def get_enumerator(max_tautomers=32):
+    """Return a TautomerEnumerator configured for max_tautomers, built once."""
+    enumerator = rdMolStandardize.TautomerEnumerator()
+    enumerator.SetMaxTautomers(max_tautomers)
+    return enumerator
+
+
+def enumerate_tautomers_rdkit(smiles, max_tautomers=32, max_shown=None, mol=None):
+    """Enumerate tautomers using RDKit.
+
+    If max_shown is set, only the first max_shown tautomers are listed and
+    a "truncated" flag is added to the result. mol may be passed in when the
+    caller already has smiles parsed; otherwise it goes through _molcache.
+    """
+    if mol is None:
+        mol = _molcache.parse(smiles)
+    if mol is None:
+        return {"error": f"Failed to parse SMILES: {smiles}"}
+
+    if not has_tautomer_site(mol):
+        # Nothing can move: the input is its only (and canonical) tautomer
+        canonical_smiles = Chem.MolToSmiles(mol)
+        results = [canonical_smiles]
+    else:
+        enumerator = get_enumerator(max_tautomers)
+
+        # Get all tautomers
+        tautomers = enumerator.Enumerate(mol)
+
+        # TautomerEnumeratorResult already holds the canonical SMILES it keyed
+        # each tautomer by, so only fall back to writing them ourselves on
+        # RDKit builds that do not expose it.
+        tautomer_smiles = getattr(tautomers, "smiles", None)
+        if tautomer_smiles is None:
+            tautomer_smiles = (Chem.MolToSmiles(taut) for taut in tautomers)
+
+        # Drop duplicate structures (symmetric inputs) by canonical SMILES.
+        # InChIKey is not used: standard InChI treats mobile H as equivalent,
+        # so it would merge distinct tautomers.
+        seen = set()
+        results = []
+        for taut_smiles in tautomer_smiles:
+            if taut_smiles in seen:
+                continue
+            seen.add(taut_smiles)
+            results.append(taut_smiles)
+
+        # Get canonical tautomer
+        canonical = enumerator.Canonicalize(mol)
+        canonical_smiles = Chem.MolToSmiles(canonical)
+
+    result = {
+        "input": smiles,
+        "count": len(results),
+        "tautomers": results,
+        "canonical": canonical_smiles
+    }
+    if max_shown is not None:
+        result["tautomers"] = results[:max_shown]
+        result["truncated"] = len(results) > max_shown
+    return result
+
+
+def load_cases(path):
+    """Load (smiles, name, max_tautomers) test cases from a CSV file.
+
+    Columns are smiles,name,max_tautomers; max_tautomers may be left empty
+    (None). Blank lines and lines starting with '#' are ignored.
+    """
+    with open(path, newline="") as f:
+        lines = (line for line in f if line.strip() and not line.startswith("#"))
+        return [
+            (row["smiles"], row["name"], int(row["max_tautomers"]) if row.get("max_tautomers") else None)
+            for row in csv.DictReader(lines)
+        ]
+
+
+def _worker(args):
+    smiles, blob, max_tautomers, max_shown = args
+    mol = _molcache.from_binary(blob)
+    return enumerate_tautomers_rdkit(smiles, max_tautomers, max_shown, mol)
+
+
+def _report(name, smiles):
+    def callback(future):
+        print(f"Processed: {name} ({smiles})", file=sys.stderr)
+        result = future.result()
+        if "count" in result:
+            print(f"  → Found {result['count']} tautomers", file=sys.stderr)
+    return callback
+
+
+class _SerialExecutor:
+    """Executor stand-in that runs each job immediately in this process."""
+
+    def submit(self, fn, *args):
+        future = Future()
+        future.set_result(fn(*args))
+        return future
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+def iter_cases(test_cases, max_tautomers=32, max_shown=None, parallel=True):
+    """Enumerate tautomers for test cases, in parallel unless parallel=False.
+
+    Each case is (smiles, name) or (smiles, name, max_tautomers); a missing
+    or None per-case limit falls back to max_tautomers. Progress is reported
+    on stderr as each molecule finishes; results are yielded in the order of
+    test_cases so callers can stream them out. Cases that are aliases of the
+    same molecule (same canonical SMILES and limit) are enumerated only once.
+
+    At most twice the worker count is queued at a time (one case in serial
+    mode), and a result is released as soon as its last alias has been
+    yielded, so the tautomer results held in memory stay bounded. Every
+    case is still parsed up front, and its Mol blob stays in _molcache, so
+    the parent's memory for the inputs themselves grows with the number of
+    cases.
+    """
+    workers = os.cpu_count() or 1
+    window = 2 * workers if parallel else 1
+
+    # Key every case up front so we know when an enumeration is no longer
+    # needed by any later alias.
+    keyed = []
+    for smiles, name, *rest in test_cases:
+        limit = rest[0] if rest and rest[0] is not None else max_tautomers
+        mol = _molcache.parse(smiles)
+        key = (Chem.MolToSmiles(mol) if mol is not None else smiles, limit)
+        keyed.append((smiles, name, limit, key))
+    remaining = Counter(key for *_, key in keyed)
+
+    with ProcessPoolExecutor(max_workers=workers) if parallel else _SerialExecutor() as ex:
+        by_key = {}
+        pending = deque()
+
+        def take():
+            smiles, name, key, future = pending.popleft()
+            remaining[key] -= 1
+            if not remaining[key]:
+                del by_key[key]
+            result = dict(future.result())
+            if "input" in result:
+                result["input"] = smiles
+            result["name"] = name
+            return result
+
+        for smiles, name, limit, key in keyed:
+            future = by_key.get(key)
+            if future is None:
+                # Parsed once above; workers get the binary blob, not the SMILES
+                blob = _molcache.binary(smiles)
+                future = ex.submit(_worker, (smiles, blob, limit, max_shown))
+                by_key[key] = future
+            future.add_done_callback(_report(name, smiles))
+            pending.append((smiles, name, key, future))
+            if len(pending) >= window:
+                yield take()
+        while pending:
+            yield take()